@@ -1,14 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from src.data_loader import load_data, get_data_dictionary
 from src.quality_audit import DataQualityAudit # Legacy
 from src.cleaning_engine import CleaningEngine
 from modules.data_audit import run_audit
-from modules.cleaning import DataCleaner
+from modules.cleaning import DataCleaner, ROW_KEY
 from modules.visualization import Visualizer
 from modules.insights import InsightGenerator
 
+# Copy-on-Write: derived frames share buffers until one of them is modified
+pd.set_option('mode.copy_on_write', True)
+
 # Page Config
 st.set_page_config(page_title="National Vocational Competition - Data Audit", layout="wide")
 
@@ -72,9 +78,69 @@ if not os.path.exists(DATA_PATH):
 if 'clean_df' not in st.session_state:
     with st.spinner("🚀 Loading 200k rows with optimized caching..."):
         st.session_state.raw_df = load_data(DATA_PATH)
-        st.session_state.clean_df = st.session_state.raw_df.copy()
+        st.session_state.clean_df = st.session_state.raw_df.copy(deep=False)
         st.session_state.engine = CleaningEngine(st.session_state.clean_df)
         st.session_state.cleaning_log = []
+        st.session_state._log_html = ""
+        st.session_state._log_html_len = 0
+
+# Cached Computations
+# The frames are passed as underscore arguments so Streamlit does not hash
+# 200k rows; results are keyed on the cleaning log (identical logs applied to
+# the same raw data give identical frames) plus the active filter selection.
+@st.cache_data(show_spinner=False)
+def cached_agency_options(data_version: tuple, _df: pd.DataFrame) -> list:
+    agencies = _df['Agency Name']
+    if isinstance(agencies.dtype, pd.CategoricalDtype):
+        # Categories still in use, found with an integer pass over the codes
+        codes = agencies.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(agencies.cat.categories)) > 0
+        return sorted(agencies.cat.categories[used].tolist())
+    return sorted(agencies.unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def cached_year_options(data_version: tuple, _df: pd.DataFrame) -> list:
+    return sorted(_df['Vehicle Year'].dropna().unique().astype(int).tolist())
+
+# The filtered view is held as a shared resource rather than cache_data: it
+# is returned without a pickle round-trip, and nothing writes to it (under
+# Copy-on-Write a write would copy rather than touch the cached frame).
+@st.cache_resource(show_spinner=False, max_entries=32)
+def cached_filtered_view(view_key: tuple, _df: pd.DataFrame) -> pd.DataFrame:
+    _, agencies, years = view_key
+    # Both conditions are fused into one mask so only a single filtered frame is built
+    mask = np.ones(len(_df), dtype=bool)
+    if agencies:
+        mask &= _df['Agency Name'].isin(agencies).to_numpy()
+    if years:
+        mask &= _df['Vehicle Year'].isin(years).to_numpy()
+    return _df.loc[mask]
+
+@st.cache_data(show_spinner=False)
+def cached_audit(view_key: tuple, _df: pd.DataFrame) -> dict:
+    return run_audit(_df)
+
+@st.cache_data(show_spinner=False)
+def cached_data_dictionary(view_key: tuple, _df: pd.DataFrame) -> pd.DataFrame:
+    return get_data_dictionary(_df)
+
+@st.cache_data(show_spinner=False)
+def cached_insight(view_key: tuple, _df: pd.DataFrame) -> str:
+    # Reuses the audit's null counts and the comparison tab's agency counts
+    agency_counts = None
+    if 'Agency Name' in _df.columns:
+        agency_counts = Visualizer.get_category_counts(_df, 'Agency Name', view_key)
+    return InsightGenerator.generate_automated_insight(
+        _df,
+        null_counts=cached_audit(view_key, _df)['null_counts'],
+        agency_counts=agency_counts,
+    )
+
+@st.cache_data(show_spinner=False)
+def cached_metrics(data_version: tuple, _df: pd.DataFrame) -> dict:
+    return DataCleaner.get_metrics(_df)
+
+data_version = tuple(st.session_state.cleaning_log)
 
 # Sidebar Navigation
 st.sidebar.title("Navigation")
@@ -85,29 +151,34 @@ st.sidebar.divider()
 st.sidebar.subheader("🌍 Global Filters")
 with st.sidebar:
     # Filter by Agency
-    agencies = sorted(st.session_state.clean_df['Agency Name'].unique().tolist())
+    agencies = cached_agency_options(data_version, st.session_state.clean_df)
     selected_agencies = st.multiselect("Filter by Agency", agencies, default=[])
     
     # Filter by Year
     if 'Vehicle Year' in st.session_state.clean_df.columns:
-        years = sorted(st.session_state.clean_df['Vehicle Year'].dropna().unique().astype(int).tolist())
+        years = cached_year_options(data_version, st.session_state.clean_df)
         selected_years = st.multiselect("Filter by Vehicle Year", years, default=[])
     else:
         selected_years = []
 
 # Apply Global Filters to a TEMPORARY dataframe for display
-filtered_df = st.session_state.clean_df.copy()
-if selected_agencies:
-    filtered_df = filtered_df[filtered_df['Agency Name'].isin(selected_agencies)]
-if selected_years:
-    filtered_df = filtered_df[filtered_df['Vehicle Year'].isin(selected_years)]
+view_key = (data_version, tuple(selected_agencies), tuple(selected_years))
+filtered_df = st.session_state.clean_df
+if selected_agencies or selected_years:
+    filtered_df = cached_filtered_view(view_key, filtered_df)
 
 # Sidebar - Transformation Steps
 st.sidebar.divider()
 st.sidebar.subheader("🛤️ Transformation Steps")
 if st.session_state.cleaning_log:
-    for step in st.session_state.cleaning_log:
-        st.sidebar.markdown(f"""<div class="transformation-card">{step}</div>""", unsafe_allow_html=True)
+    # Rendered HTML is kept in session state and only the new steps are appended;
+    # the whole log is emitted with a single markdown call
+    log = st.session_state.cleaning_log
+    if st.session_state._log_html_len < len(log):
+        st.session_state._log_html += "".join(
+            f"""<div class="transformation-card">{step}</div>""" for step in log[st.session_state._log_html_len:])
+        st.session_state._log_html_len = len(log)
+    st.sidebar.markdown(st.session_state._log_html, unsafe_allow_html=True)
 else:
     st.sidebar.info("No transformations applied yet.")
 
@@ -116,16 +187,16 @@ if page == "Dashboard":
     st.header("📊 Dataset Overview")
     
     # --- Automated Insight Integration ---
-    st.markdown(f"""<div class="insight-card">{InsightGenerator.generate_automated_insight(filtered_df)}</div>""", unsafe_allow_html=True)
+    st.markdown(f"""<div class="insight-card">{cached_insight(view_key, filtered_df)}</div>""", unsafe_allow_html=True)
 
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Current View Rows", f"{len(filtered_df):,}")
     col2.metric("Total Stats Columns", len(filtered_df.columns))
     
-    # Calculate simple completeness for dashboard
-    null_ratio = (filtered_df.isnull().sum().sum() / 
-                  (len(filtered_df) * len(filtered_df.columns))) if not filtered_df.empty else 1
-    col3.metric("Global Completeness", f"{(1-null_ratio)*100:.1f}%")
+    # Completeness comes from the cached audit (mean column completeness equals
+    # the global non-null ratio, as every column has the same row count)
+    completeness = cached_audit(view_key, filtered_df)['scores']['completeness'] if not filtered_df.empty else 0
+    col3.metric("Global Completeness", f"{completeness:.1f}%")
     col4.metric("Clean Status", "Verified" if not st.session_state.cleaning_log else "Modified")
 
     st.subheader("Filtered Sample (Top 5)")
@@ -139,7 +210,7 @@ elif page == "Refined Audit":
     st.header("🔎 Advanced Data Health Audit")
     
     with st.spinner("🔍 Running detailed audit..."):
-        audit_results = run_audit(filtered_df)
+        audit_results = cached_audit(view_key, filtered_df)
     
     if filtered_df.empty:
         st.warning("Please adjust filters to see audit results.")
@@ -164,11 +235,13 @@ elif page == "Refined Audit":
         st.subheader("📋 Column Quality Status")
         stats_df = pd.DataFrame(audit_results['column_stats'])
         
-        def color_status(val):
-            color = '#28a745' if val == 'Valid' else '#ffc107' if val == 'Warning' else '#dc3545'
-            return f'color: {color}; font-weight: bold'
+        # Status colour as an emoji badge: a plain frame renders client-side,
+        # whereas a pandas Styler builds per-cell HTML on every rerun
+        status_badges = {'Valid': '🟢 Valid', 'Warning': '🟡 Warning', 'Critical': '🔴 Critical'}
+        stats_df['Status'] = stats_df['Status'].map(status_badges)
 
-        st.dataframe(stats_df.style.map(color_status, subset=['Status']), use_container_width=True)
+        st.dataframe(stats_df, use_container_width=True,
+                     column_config={'Status': st.column_config.TextColumn('Status')})
 
         # Textual Summary
         st.subheader("💬 Audit Summary & Justification")
@@ -184,7 +257,7 @@ elif page == "Interactive Cleaning":
     st.info("💡 Note: Cleaning operations apply to the FULL working dataset, not just the current filtered view.")
     
     # Before Metrics
-    st.session_state.before_metrics = DataCleaner.get_metrics(st.session_state.clean_df)
+    st.session_state.before_metrics = cached_metrics(data_version, st.session_state.clean_df)
     
     col_input, col_action = st.columns([1, 1])
     
@@ -210,8 +283,13 @@ elif page == "Interactive Cleaning":
             st.rerun()
 
         st.subheader("🔗 Referential Integrity")
-        if st.button("🗑️ Drop All Duplicates"):
-            st.session_state.clean_df, msg = DataCleaner.drop_duplicates(st.session_state.clean_df)
+        row_key_label = " + ".join(ROW_KEY)
+        has_row_key = all(col in st.session_state.clean_df.columns for col in ROW_KEY)
+        dedup_options = ["All Columns", row_key_label] if has_row_key else ["All Columns"]
+        dedup_key = st.radio("Duplicate Key", dedup_options, horizontal=True)
+        if st.button("🗑️ Drop Duplicates"):
+            subset = None if dedup_key == "All Columns" else ROW_KEY
+            st.session_state.clean_df, msg = DataCleaner.drop_duplicates(st.session_state.clean_df, subset=subset)
             st.session_state.cleaning_log.append(msg)
             st.success(msg)
             st.rerun()
@@ -219,7 +297,7 @@ elif page == "Interactive Cleaning":
     st.divider()
     
     # After Metrics
-    after_metrics = DataCleaner.get_metrics(st.session_state.clean_df)
+    after_metrics = cached_metrics(data_version, st.session_state.clean_df)
     
     st.subheader("⚖️ Before vs After Metrics (Global)")
     c1, c2, c3 = st.columns(3)
@@ -235,7 +313,8 @@ elif page == "Interactive Cleaning":
               delta_color="inverse")
     c3.metric("Duplicates", f"{after_metrics['duplicate_count']:,}", 
               metric_diff(after_metrics['duplicate_count'], st.session_state.before_metrics['duplicate_count']),
-              delta_color="inverse")
+              delta_color="inverse",
+              help=f"Rows repeating {' + '.join(ROW_KEY)} (all columns if any key is missing).")
 
 # --- Analytics Dashboard ---
 elif page == "Analytics Dashboard":
@@ -245,28 +324,44 @@ elif page == "Analytics Dashboard":
         st.error("No data available for visualization. Please adjust filters.")
     else:
         # --- Automated Insight Integration ---
-        st.markdown(f"""<div class="insight-card">{InsightGenerator.generate_automated_insight(filtered_df)}</div>""", unsafe_allow_html=True)
+        st.markdown(f"""<div class="insight-card">{cached_insight(view_key, filtered_df)}</div>""", unsafe_allow_html=True)
 
         # Layout
         tab_trend, tab_dist, tab_comp = st.tabs(["🕒 Trend Analysis", "📊 Distributions", "🏢 Comparisons"])
         
+        # Controls first, so the three independent aggregations can run together
         with tab_trend:
             st.subheader("Temporal Trends")
             date_col = 'Crash Date/Time'
             roll_mean = st.toggle("Show 7-Day Rolling Mean", value=False)
-            Visualizer.plot_trend(filtered_df, date_col, rolling=roll_mean)
             
         with tab_dist:
             st.subheader("Numerical Distributions")
             num_col = st.selectbox("Select Numeric Feature", ['Speed Limit', 'Vehicle Year', 'Latitude', 'Longitude'])
             hide_outliers = st.toggle("Hide Outliers (Clip to IQR)", value=False)
-            Visualizer.plot_distribution(filtered_df, num_col, show_outliers=not hide_outliers)
             
         with tab_comp:
             st.subheader("Categorical Comparisons")
             cat_col = st.selectbox("Select Category", ['Weather', 'Surface Condition', 'Light', 'Collision Type', 'Agency Name'])
             limit = st.slider("Show Top N", 5, 30, 10)
-            Visualizer.plot_comparison(filtered_df, cat_col, top_n=limit)
+
+        # pandas/NumPy kernels release the GIL, so a cache miss costs roughly the
+        # slowest of the three; workers share the script context for st.cache_data
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=3, initializer=lambda: add_script_run_ctx(ctx=ctx)) as ex:
+            trend_future = ex.submit(Visualizer.get_trend_counts, filtered_df, date_col, view_key)
+            dist_future = ex.submit(Visualizer.distribution_data, filtered_df, num_col)
+            comp_future = ex.submit(Visualizer.get_category_counts, filtered_df, cat_col, view_key)
+
+        with tab_trend:
+            Visualizer.plot_trend(filtered_df, date_col, rolling=roll_mean, counts=trend_future.result())
+            
+        with tab_dist:
+            Visualizer.plot_distribution(filtered_df, num_col, show_outliers=not hide_outliers,
+                                         dist=dist_future.result())
+            
+        with tab_comp:
+            Visualizer.plot_comparison(filtered_df, cat_col, top_n=limit, value_counts=comp_future.result())
 
 # --- Data Dictionary ---
 elif page == "Data Dictionary":
@@ -275,14 +370,16 @@ elif page == "Data Dictionary":
         st.warning("⚠️ No data available to generate dictionary. Please adjust filters.")
     else:
         st.markdown("Detailed metadata for compliance with vocational competition standards.")
-        dd = get_data_dictionary(filtered_df)
+        dd = cached_data_dictionary(view_key, filtered_df)
         st.dataframe(dd, use_container_width=True)
 
 # Empty State Global Check
 if st.session_state.clean_df.empty:
     st.error("🚨 CRITICAL: The current working dataset is EMPTY.")
     if st.button("Reset Dataset"):
-        st.session_state.clean_df = st.session_state.raw_df.copy()
+        st.session_state.clean_df = st.session_state.raw_df.copy(deep=False)
         st.session_state.engine = CleaningEngine(st.session_state.clean_df)
         st.session_state.cleaning_log = []
+        st.session_state._log_html = ""
+        st.session_state._log_html_len = 0
         st.rerun()
@@ -3,6 +3,21 @@ import numpy as np
 import streamlit as st
 from typing import Tuple, List
 
+# One row per person and vehicle involved in a report, so Report Number alone
+# repeats legitimately; duplicates are judged on the three keys together
+ROW_KEY = ['Report Number', 'Person ID', 'Vehicle ID']
+
+# Date layouts seen in crash exports, tried in order before falling back to
+# per-element inference
+KNOWN_DATE_FORMATS = [
+    '%m/%d/%Y %I:%M:%S %p',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+]
+
 class DataCleaner:
     """
     Handles interactive data cleaning operations, standardization,
@@ -12,10 +27,15 @@ class DataCleaner:
     @staticmethod
     def get_metrics(df: pd.DataFrame) -> dict:
         """Returns key metrics for before/after comparison."""
+        # Hashing the key columns is far cheaper than hashing every cell of every row
+        if all(col in df.columns for col in ROW_KEY):
+            duplicate_count = df.duplicated(subset=ROW_KEY).sum()
+        else:
+            duplicate_count = df.duplicated().sum()
         return {
             'row_count': len(df),
             'missing_count': df.isnull().sum().sum(),
-            'duplicate_count': df.duplicated().sum()
+            'duplicate_count': duplicate_count
         }
 
     @staticmethod
@@ -61,7 +81,7 @@ class DataCleaner:
     def standardize_dates(df: pd.DataFrame, col: str) -> Tuple[pd.DataFrame, str]:
         """Converts string dates to datetime objects."""
         before_count = df[col].isnull().sum()
-        df[col] = pd.to_datetime(df[col], errors='coerce')
+        df[col] = DataCleaner._parse_dates(df[col])
         after_count = df[col].isnull().sum()
         
         # Report how many failed to parse (became NaT)
@@ -71,3 +91,22 @@ class DataCleaner:
             msg += f" (Note: {failed} values failed to parse and were set to NaT)"
             
         return df, msg
+
+    @staticmethod
+    def _parse_dates(series: pd.Series, threshold: float = 0.95) -> pd.Series:
+        """
+        Parses a column with the first known format that covers at least
+        `threshold` of its non-null values; an explicit format takes pandas'
+        vectorized parser instead of per-element inference.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        
+        non_null = series.notna().sum()
+        for fmt in KNOWN_DATE_FORMATS:
+            parsed = pd.to_datetime(series, format=fmt, errors='coerce')
+            if parsed.notna().sum() >= threshold * non_null:
+                return parsed
+        
+        # Slow path: mixed or unknown layouts
+        return pd.to_datetime(series, errors='coerce')
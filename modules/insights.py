@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 class InsightGenerator:
     """
@@ -9,41 +9,49 @@ class InsightGenerator:
     """
     
     @staticmethod
-    def get_top_performer(df: pd.DataFrame, cat_col: str = 'Agency Name') -> Dict[str, Any]:
+    def get_top_performer(df: pd.DataFrame, cat_col: str = 'Agency Name',
+                          counts: Optional[pd.Series] = None) -> Dict[str, Any]:
         """Identifies the category with the highest frequency."""
         if df.empty or cat_col not in df.columns:
             return {"name": "N/A", "value": 0}
         
-        counts = df[cat_col].value_counts()
+        if counts is None:
+            counts = df[cat_col].value_counts()
         top_name = counts.index[0]
         top_val = counts.values[0]
         return {"name": top_name, "value": top_val}
 
     @staticmethod
-    def get_main_pain_point(df: pd.DataFrame) -> Dict[str, Any]:
+    def get_main_pain_point(df: pd.DataFrame, null_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Identifies the column with the highest missing value count."""
         if df.empty:
             return {"column": "N/A", "count": 0}
             
-        null_counts = df.isnull().sum()
+        if null_counts is None:
+            null_counts = df.isnull().sum()
+        else:
+            null_counts = pd.Series(null_counts)
         max_null_col = null_counts.idxmax()
         max_null_count = null_counts.max()
         
         return {"column": max_null_col, "count": max_null_count}
 
     @staticmethod
-    def generate_automated_insight(df: pd.DataFrame) -> str:
+    def generate_automated_insight(df: pd.DataFrame, *, null_counts: Optional[Dict[str, int]] = None,
+                                   agency_counts: Optional[pd.Series] = None) -> str:
         """
         Synthesizes data analysis into a structured markdown insight.
+        Precomputed per-column null counts and agency frequencies can be
+        passed in to skip the corresponding full scans.
         """
         if df.empty:
             return "### 💡 Key Insight\nNo data available to generate insights."
 
         # 1. Logic for Top Performer (Agency)
-        top_agency = InsightGenerator.get_top_performer(df, 'Agency Name')
+        top_agency = InsightGenerator.get_top_performer(df, 'Agency Name', counts=agency_counts)
         
         # 2. Logic for Pain Point (Missing Values)
-        pain_point = InsightGenerator.get_main_pain_point(df)
+        pain_point = InsightGenerator.get_main_pain_point(df, null_counts=null_counts)
         
         # 3. Time Trend (simple check)
         latest_year = "unknown"
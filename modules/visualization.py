@@ -1,7 +1,22 @@
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import streamlit as st
-from typing import Optional
+from typing import Optional, Tuple
+
+# Trend series longer than this are downsampled before being sent to the browser
+TREND_MAX_POINTS = 1500
+TREND_TARGET_POINTS = 1000
+
+@st.cache_data(show_spinner=False)
+def _cached_trend_counts(view_key: tuple, date_col: str, _df: pd.DataFrame) -> pd.DataFrame:
+    """Daily counts cached per filter state so plot-only toggles skip the aggregation."""
+    return Visualizer.trend_counts(_df, date_col)
+
+@st.cache_data(show_spinner=False)
+def _cached_category_counts(view_key: tuple, cat_col: str, _df: pd.DataFrame) -> pd.Series:
+    """Category frequencies cached per filter state so the Top N slider only slices."""
+    return Visualizer.category_counts(_df, cat_col)
 
 class Visualizer:
     """
@@ -13,26 +28,85 @@ class Visualizer:
     def sample_data(df: pd.DataFrame, n: int = 10000) -> pd.DataFrame:
         """Samples data if exceeds threshold to prevent rendering lag."""
         if len(df) > 50000:
-            return df.sample(n=n, random_state=42)
+            # Deterministic systematic sample: a strided slice needs no shuffle
+            # index and returns the same rows on every rerun
+            step = -(-len(df) // n)
+            return df.iloc[::step]
         return df
 
     @staticmethod
-    def plot_trend(df: pd.DataFrame, date_col: str, rolling: bool = False, window: int = 7):
+    def trend_counts(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
+        """Counts records per calendar day."""
+        # date_col is parsed to datetime64 at load time; flooring stays in int64
+        # arithmetic instead of building a Python date object per row
+        day = df[date_col].dt.floor('D')
+        return day.value_counts().sort_index().rename_axis('Date').reset_index(name='Crash Count')
+
+    @staticmethod
+    def get_trend_counts(df: pd.DataFrame, date_col: str, view_key: Optional[tuple] = None) -> pd.DataFrame:
+        """Daily counts, served from the cache when a view_key is given."""
+        if view_key is not None:
+            return _cached_trend_counts(view_key, date_col, df)
+        return Visualizer.trend_counts(df, date_col)
+
+    @staticmethod
+    def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+        """
+        Largest-Triangle-Three-Buckets downsampling. Returns the positions of
+        `n_out` points that preserve the visual shape (peaks and troughs) of
+        the series; the first and last points are always kept.
+        """
+        n = len(y)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        
+        # Work in float days so datetime x values keep their spacing
+        if np.issubdtype(x.dtype, np.datetime64):
+            x = (x - x[0]) / np.timedelta64(1, 'D')
+        x = x.astype('float64')
+        y = y.astype('float64')
+        
+        every = (n - 2) / (n_out - 2)
+        keep = np.empty(n_out, dtype=np.int64)
+        keep[0], keep[-1] = 0, n - 1
+        a = 0
+        for i in range(n_out - 2):
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            # Average of the next bucket is the third triangle vertex
+            next_end = min(int((i + 2) * every) + 1, n)
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+            area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                          (x[a] - x[start:end]) * (avg_y - y[a]))
+            a = start + int(np.argmax(area))
+            keep[i + 1] = a
+        return keep
+
+    @staticmethod
+    def plot_trend(df: pd.DataFrame, date_col: str, rolling: bool = False, window: int = 7,
+                   view_key: Optional[tuple] = None, counts: Optional[pd.DataFrame] = None):
         """Generates a trend analysis line chart."""
-        df_plot = df.copy()
-        df_plot[date_col] = pd.to_datetime(df_plot[date_col])
-        counts = df_plot.groupby(df_plot[date_col].dt.date).size().reset_index(name='Crash Count')
-        counts.columns = ['Date', 'Crash Count']
+        if counts is None:
+            counts = Visualizer.get_trend_counts(df, date_col, view_key)
         
         title = "Crash Trends Over Time"
         if len(df) > 50000:
             title += " (Full Dataset Counted)"
+        
+        # Rolling mean is computed on the full series, before any downsampling
+        if rolling:
+            counts['Rolling Mean'] = counts['Crash Count'].rolling(window=window).mean()
+        
+        if len(counts) > TREND_MAX_POINTS:
+            keep = Visualizer.lttb_indices(counts['Date'].to_numpy(), counts['Crash Count'].to_numpy(),
+                                           TREND_TARGET_POINTS)
+            counts = counts.iloc[keep]
             
         fig = px.line(counts, x='Date', y='Crash Count', title=title, 
                       template="plotly_white", color_discrete_sequence=['#667eea'])
         
         if rolling:
-            counts['Rolling Mean'] = counts['Crash Count'].rolling(window=window).mean()
             fig.add_scatter(x=counts['Date'], y=counts['Rolling Mean'], name=f'{window}-Day Rolling Mean',
                             line=dict(color='#ff7f0e', width=3))
             
@@ -40,9 +114,19 @@ class Visualizer:
         st.plotly_chart(fig, use_container_width=True)
 
     @staticmethod
-    def plot_distribution(df: pd.DataFrame, num_col: str, show_outliers: bool = True):
+    def distribution_data(df: pd.DataFrame, num_col: str) -> Tuple[pd.DataFrame, float, float]:
+        """Returns the (sampled) rows to plot and the column's first and third quartiles."""
+        df_plot = Visualizer.sample_data(df)[[num_col]]
+        q1, q3 = df[num_col].quantile([0.25, 0.75]).tolist()
+        return df_plot, q1, q3
+
+    @staticmethod
+    def plot_distribution(df: pd.DataFrame, num_col: str, show_outliers: bool = True,
+                          dist: Optional[Tuple[pd.DataFrame, float, float]] = None):
         """Generates a distribution histogram and boxplot with outlier toggle."""
-        df_plot = Visualizer.sample_data(df)
+        if dist is None:
+            dist = Visualizer.distribution_data(df, num_col)
+        df_plot, q1, q3 = dist
         is_sampled = len(df) > 50000
         
         title = f"Distribution of {num_col}"
@@ -55,19 +139,33 @@ class Visualizer:
         
         if not show_outliers:
             # Simple outlier removal for visualization: Clip to 1.5 * IQR
-            q1 = df[num_col].quantile(0.25)
-            q3 = df[num_col].quantile(0.75)
             iqr = q3 - q1
             fig.update_xaxes(range=[q1 - 1.5 * iqr, q3 + 1.5 * iqr])
             
         st.plotly_chart(fig, use_container_width=True)
 
     @staticmethod
-    def plot_comparison(df: pd.DataFrame, cat_col: str, top_n: int = 10):
+    def category_counts(df: pd.DataFrame, cat_col: str) -> pd.Series:
+        """Frequency of each category, sorted descending."""
+        vc = df[cat_col].value_counts()
+        # Categoricals also list unobserved categories with a count of 0
+        return vc[vc > 0]
+
+    @staticmethod
+    def get_category_counts(df: pd.DataFrame, cat_col: str, view_key: Optional[tuple] = None) -> pd.Series:
+        """Category frequencies, served from the cache when a view_key is given."""
+        if view_key is not None:
+            return _cached_category_counts(view_key, cat_col, df)
+        return Visualizer.category_counts(df, cat_col)
+
+    @staticmethod
+    def plot_comparison(df: pd.DataFrame, cat_col: str, top_n: int = 10,
+                        view_key: Optional[tuple] = None, value_counts: Optional[pd.Series] = None):
         """Generates a bar chart for categorical comparison, sorted descending."""
-        counts = df[cat_col].value_counts().reset_index()
+        if value_counts is None:
+            value_counts = Visualizer.get_category_counts(df, cat_col, view_key)
+        counts = value_counts.head(top_n).reset_index()
         counts.columns = [cat_col, 'Count']
-        counts = counts.sort_values(by='Count', ascending=False).head(top_n)
         
         fig = px.bar(counts, x=cat_col, y='Count', title=f"Top {top_n} {cat_col}",
                      color='Count', color_continuous_scale='Viridis',
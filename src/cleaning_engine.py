@@ -9,7 +9,9 @@ class CleaningEngine:
     """
     
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # No copy: every operation below rebinds self.df to a new frame, and
+        # Copy-on-Write keeps the caller's frame untouched
+        self.df = df
         self.history: List[Dict] = []
 
     def log_step(self, operation: str, impact: str):
@@ -23,7 +25,7 @@ class CleaningEngine:
     def drop_nulls(self, columns: List[str]) -> pd.DataFrame:
         """Drops rows with null values in specified columns."""
         before = len(self.df)
-        self.df.dropna(subset=columns, inplace=True)
+        self.df = self.df.dropna(subset=columns)
         after = len(self.df)
         self.log_step(f"Drop Nulls in {', '.join(columns)}", f"Removed {before - after} rows.")
         return self.df
@@ -31,7 +33,7 @@ class CleaningEngine:
     def fill_nulls(self, column: str, value: any) -> pd.DataFrame:
         """Fills null values in a column with a constant."""
         count = self.df[column].isnull().sum()
-        self.df[column].fillna(value, inplace=True)
+        self.df = self.df.assign(**{column: self.df[column].fillna(value)})
         self.log_step(f"Fill Nulls in {column}", f"Filled {count} values with '{value}'.")
         return self.df
 
@@ -1,7 +1,75 @@
+from dataclasses import dataclass
+from functools import cached_property
 import pandas as pd
 import numpy as np
-import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+def _is_arrow_backed(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.ArrowDtype) or getattr(series.dtype, 'storage', None) == 'pyarrow'
+
+@dataclass(slots=True)
+class AccuracyResult:
+    """Row counts failing the range checks; messages are only built for display."""
+    bad_coords: int = 0
+    bad_speed: int = 0
+
+    def to_display_dict(self) -> Dict[str, Any]:
+        issues = []
+        if self.bad_coords:
+            issues.append(f"Found {self.bad_coords} rows with invalid GPS coordinates.")
+        if self.bad_speed:
+            issues.append(f"Found {self.bad_speed} rows with suspicious Speed Limit values.")
+        return {
+            'status': 'Pass' if not issues else 'Warning',
+            'issues': issues
+        }
+
+@dataclass(slots=True)
+class ConsistencyResult:
+    """Row counts failing the cross-column checks; messages are only built for display."""
+    vehicle_year_ahead: int = 0
+
+    def to_display_dict(self) -> Dict[str, Any]:
+        issues = []
+        if self.vehicle_year_ahead:
+            issues.append(f"Found {self.vehicle_year_ahead} rows where Vehicle Year is ahead of Crash Date.")
+        return {
+            'status': 'Pass' if not issues else 'Warning',
+            'issues': issues
+        }
+
+# Accuracy kernels. Counts come from NumPy masks directly; no filtered frame
+# is materialised.
+def _count(mask: np.ndarray) -> int:
+    # any() stops at the first hit; the full count is only needed to report
+    return int(np.count_nonzero(mask)) if mask.any() else 0
+
+def _bad_coords(lat: np.ndarray, lon: np.ndarray) -> int:
+    # |x| > bound covers both ends in one comparison; NaN still compares False
+    return _count((np.abs(lat) > 90) | (np.abs(lon) > 180))
+
+def _bad_speed(speed: np.ndarray) -> int:
+    return _count((speed < 0) | (speed > 100))
+
+def _accuracy_full(lat, lon, speed) -> AccuracyResult:
+    return AccuracyResult(bad_coords=_bad_coords(lat, lon), bad_speed=_bad_speed(speed))
+
+def _accuracy_gps(lat, lon, speed) -> AccuracyResult:
+    return AccuracyResult(bad_coords=_bad_coords(lat, lon))
+
+def _accuracy_speed(lat, lon, speed) -> AccuracyResult:
+    return AccuracyResult(bad_speed=_bad_speed(speed))
+
+def _accuracy_none(lat, lon, speed) -> AccuracyResult:
+    return AccuracyResult()
+
+# Keyed by (has Latitude and Longitude, has Speed Limit)
+_ACCURACY_VARIANTS = {
+    (True, True): _accuracy_full,
+    (True, False): _accuracy_gps,
+    (False, True): _accuracy_speed,
+    (False, False): _accuracy_none,
+}
 
 class DataQualityAudit:
     """
@@ -12,77 +80,175 @@ class DataQualityAudit:
     def __init__(self, df: pd.DataFrame):
         self.df = df
         self.results = {}
+        has_gps = 'Latitude' in df.columns and 'Longitude' in df.columns
+        self._accuracy_fn = _ACCURACY_VARIANTS[has_gps, 'Speed Limit' in df.columns]
+
+    # Nullable booleans go through pandas' masked-array path, which is far
+    # slower for row-wise reductions, so the checks that walk every column see
+    # them cast to NumPy bool. Missing values become False; their counts are
+    # kept beforehand for the completeness check.
+    @cached_property
+    def _bool_nulls(self) -> Dict[str, int]:
+        return {col: int(self.df[col].isna().sum())
+                for col, dtype in self.df.dtypes.items() if isinstance(dtype, pd.BooleanDtype)}
+
+    @cached_property
+    def _frame(self) -> pd.DataFrame:
+        if not self._bool_nulls:
+            return self.df
+        bool_cols = list(self._bool_nulls)
+        return self.df.fillna({col: False for col in bool_cols}).astype({col: 'bool' for col in bool_cols})
+
+    # Columns read by the range and logic checks are extracted once per
+    # instance as float arrays (NaN for missing) and shared by every
+    # dimension, instead of each check going back to the DataFrame. NumPy
+    # float columns keep their own width so boundary values compare at
+    # native precision; anything else is converted to float64.
+    def _float_column(self, col: str) -> Optional[np.ndarray]:
+        if col not in self.df.columns:
+            return None
+        series = self.df[col]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == 'f':
+            return series.to_numpy()
+        return series.to_numpy(dtype=float, na_value=np.nan)
 
-    @st.cache_resource
-    def run_all_audits(_self) -> Dict[str, Any]:
+    @cached_property
+    def _lat(self) -> Optional[np.ndarray]:
+        return self._float_column('Latitude')
+
+    @cached_property
+    def _lon(self) -> Optional[np.ndarray]:
+        return self._float_column('Longitude')
+
+    @cached_property
+    def _speed(self) -> Optional[np.ndarray]:
+        return self._float_column('Speed Limit')
+
+    @cached_property
+    def _vehicle_year(self) -> Optional[np.ndarray]:
+        return self._float_column('Vehicle Year')
+
+    def _take(self, mask: np.ndarray) -> pd.DataFrame:
+        """
+        Rows of the audited frame where `mask` is True, e.g. to show the rows a
+        check flagged. Gathers by position with `take` instead of applying the
+        boolean filter to every column (cf. ARROW-10569).
+        """
+        return self.df.take(np.flatnonzero(mask))
+
+    @staticmethod
+    def _null_count(series: pd.Series) -> int:
+        """Null count of a column, read from Arrow metadata when the column is Arrow-backed."""
+        if _is_arrow_backed(series):
+            # Arrow keeps the validity-bitmap null count with the array: O(1), no mask
+            return series.array.__arrow_array__().null_count
+        return int(series.isna().sum())
+
+    def _null_counts(self) -> Dict[str, int]:
+        """Per-column null counts, dispatched on each column's dtype."""
+        # One column at a time, so no rows x cols copy or mask is built;
+        # extension (Arrow, categorical) columns stay on their native null paths
+        null_counts = {}
+        for col, series in self._frame.items():
+            dtype = series.dtype
+            if not isinstance(dtype, np.dtype):
+                null_counts[col] = self._null_count(series)
+            elif dtype.kind in 'iub':
+                # NumPy ints and bools cannot hold a missing value, apart from
+                # the ones filled when nullable booleans were cast (see _frame)
+                null_counts[col] = self._bool_nulls.get(col, 0)
+            elif dtype.kind == 'f':
+                null_counts[col] = int(np.isnan(series.to_numpy()).sum())
+            elif dtype.kind in 'mM':
+                null_counts[col] = int(np.isnat(series.to_numpy()).sum())
+            else:
+                null_counts[col] = int(series.isna().sum())
+        return null_counts
+
+    @cached_property
+    def _crash_ts(self) -> Optional[np.ndarray]:
+        if 'Crash Date/Time' not in self.df.columns:
+            return None
+        return self.df['Crash Date/Time'].to_numpy(dtype='datetime64[ns]')
+
+    @cached_property
+    def _crash_year(self) -> Optional[np.ndarray]:
+        """Calendar year of each crash as float32 (NaN for NaT), computed once per audit."""
+        ts = self._crash_ts
+        if ts is None:
+            return None
+        # datetime64[Y] counts whole years since 1970
+        years = ts.astype('datetime64[Y]').astype('int64').astype('float32') + 1970
+        years[np.isnat(ts)] = np.nan
+        return years
+
+    def run_all_audits(self) -> Dict[str, Any]:
         """Runs all 4 audit dimensions and returns the results."""
-        _self.results['completeness'] = _self.check_completeness()
-        _self.results['accuracy'] = _self.check_accuracy()
-        _self.results['consistency'] = _self.check_consistency()
-        _self.results['timeliness'] = _self.check_timeliness()
-        return _self.results
+        if self.df.empty:
+            # Nothing to traverse: skip all four passes
+            self.results = {
+                'completeness': {'ratio': 100.0, 'missing_by_column': {}},
+                'accuracy': {'status': 'Pass', 'issues': []},
+                'consistency': {'status': 'Pass', 'issues': []},
+                'timeliness': {'status': 'N/A', 'message': 'No rows to audit.'}
+            }
+            return self.results
+
+        # Not cached: the checks are cheaper than hashing the frame for a key
+        self.results = {
+            'completeness': self.check_completeness(),
+            'accuracy': self.check_accuracy().to_display_dict(),
+            'consistency': self.check_consistency().to_display_dict(),
+            'timeliness': self.check_timeliness(),
+        }
+        return self.results
 
     def check_completeness(self) -> Dict[str, Any]:
         """Checks for null values and calculates completion percentage."""
-        null_counts = self.df.isnull().sum()
-        total_rows = len(self.df)
-        completeness_ratio = (1 - (null_counts.sum() / (total_rows * len(self.df.columns)))) * 100
+        null_counts = self._null_counts()
+        total_cells = len(self.df) * len(self.df.columns)
+        completeness_ratio = (1 - (sum(null_counts.values()) / total_cells)) * 100 if total_cells else np.nan
         
         return {
             'ratio': completeness_ratio,
-            'missing_by_column': null_counts[null_counts > 0].to_dict()
+            'missing_by_column': {col: n for col, n in null_counts.items() if n > 0}
         }
 
-    def check_accuracy(self) -> Dict[str, Any]:
+    def check_accuracy(self) -> AccuracyResult:
         """Validates data ranges and logical boundaries (e.g., coordinates)."""
-        issues = []
-        
-        # Latitude/Longitude range check
-        if 'Latitude' in self.df.columns and 'Longitude' in self.df.columns:
-            invalid_coords = self.df[
-                (self.df['Latitude'] < -90) | (self.df['Latitude'] > 90) |
-                (self.df['Longitude'] < -180) | (self.df['Longitude'] > 180)
-            ]
-            if not invalid_coords.empty:
-                issues.append(f"Found {len(invalid_coords)} rows with invalid GPS coordinates.")
-
-        # Numeric validity (e.g., Speed Limit)
-        if 'Speed Limit' in self.df.columns:
-            invalid_speed = self.df[(self.df['Speed Limit'] < 0) | (self.df['Speed Limit'] > 100)]
-            if not invalid_speed.empty:
-                issues.append(f"Found {len(invalid_speed)} rows with suspicious Speed Limit values.")
-
-        return {
-            'status': 'Pass' if not issues else 'Warning',
-            'issues': issues
-        }
+        # Variant picked in __init__ for the columns present; absent ones are None
+        return self._accuracy_fn(self._lat, self._lon, self._speed)
 
-    def check_consistency(self) -> Dict[str, Any]:
+    def check_consistency(self) -> ConsistencyResult:
         """Logic checks between related columns."""
-        issues = []
+        result = ConsistencyResult()
         
         # Crash Date/Time vs Vehicle Year
-        if 'Crash Date/Time' in self.df.columns and 'Vehicle Year' in self.df.columns:
+        if self._crash_year is not None and self._vehicle_year is not None:
             # Simple check: Vehicle year should not be far in the future compared to crash date
             # Allowing +1 for new models released early
-            df_temp = self.df.copy()
-            df_temp['Crash Year'] = df_temp['Crash Date/Time'].dt.year
-            inconsistent = df_temp[df_temp['Vehicle Year'] > (df_temp['Crash Year'] + 1)]
-            if not inconsistent.empty:
-                issues.append(f"Found {len(inconsistent)} rows where Vehicle Year is ahead of Crash Date.")
+            # Plain arrays instead of a frame copy with an extra column; NaN
+            # (missing year or NaT crash date) compares False.
+            inconsistent = (self._vehicle_year - self._crash_year) > 1
+            if inconsistent.any():
+                result.vehicle_year_ahead = int(np.count_nonzero(inconsistent))
 
-        return {
-            'status': 'Pass' if not issues else 'Warning',
-            'issues': issues
-        }
+        return result
 
     def check_timeliness(self) -> Dict[str, Any]:
         """Analyzes the freshness and distribution of data."""
-        if 'Crash Date/Time' in self.df.columns:
-            min_date = self.df['Crash Date/Time'].min()
-            max_date = self.df['Crash Date/Time'].max()
-            date_range = (max_date - min_date).days
-            
+        if self._crash_ts is not None:
+            # Reduce on the datetime64 array; NumPy propagates NaT, so drop it first
+            ts = self._crash_ts[~np.isnat(self._crash_ts)]
+            if ts.size:
+                mn, mx = ts.min(), ts.max()
+                date_range = int((mx - mn) // np.timedelta64(1, 'D'))
+                # Timestamps only for display
+                min_date, max_date = pd.Timestamp(mn), pd.Timestamp(mx)
+            else:
+                min_date = max_date = pd.NaT
+                date_range = np.nan
+
             return {
                 'data_range_days': date_range,
                 'min_date': min_date,